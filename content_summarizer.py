@@ -7,42 +7,198 @@ python content_summarizer.py
 # Web mode with custom files
 python content_summarizer.py --mode web --input my_urls.txt --output my_summaries/
 
+# Web mode through the OpenAI Batch API (cheaper, results within 24h)
+python content_summarizer.py --batch
+
 # Text file mode (default input.txt)
 python content_summarizer.py --mode text
 
 # Text file with custom input/output
 python content_summarizer.py --mode text --input article.txt --output article_summary.md
+
+# Either mode with a different prompt template
+python content_summarizer.py --prompt-template my_prompt.txt
 """
 
 import argparse
+import asyncio
+import functools
+import hashlib
+import json
 import os
-
+import re
+import time
+from pathlib import Path
+from typing import Optional
+from urllib.parse import urlsplit, urlunsplit
+
+import diskcache
+import httpx
 import litellm
-import requests
-from bs4 import BeautifulSoup
+import tiktoken
+from selectolax.parser import HTMLParser
+from tenacity import (
+    retry,
+    retry_if_exception,
+    retry_if_exception_type,
+    stop_after_attempt,
+    wait_exponential,
+)
+
+# Max URLs fetched/summarized at once; keeps us under provider rate limits
+MAX_CONCURRENCY = 15
+
+PROMPT_PLACEHOLDER = "{{ insert blog post or raw dev thread here }}"
+
+# Default prompt template (--prompt-template overrides); built-in prompt if missing
+PROMPT_FILE = "prompt.txt"
+DEFAULT_PROMPT_TEMPLATE = (
+    f"Please summarize the following content:\n\n{PROMPT_PLACEHOLDER}\n"
+)
+
+# MODEL = "gpt-4o"
+MODEL = "xai/grok-4"
+
+# Articles packed into one LLM request; returns diminish past ~8
+ARTICLES_PER_REQUEST = 5
+
+# OpenAI Batch API (--batch): half price, results within 24h
+BATCH_MODEL = "gpt-4o"
+BATCH_POLL_SECONDS = 60
+# Consecutive failed status checks tolerated before giving up on polling
+BATCH_MAX_POLL_ERRORS = 10
+
+# Pages larger than this are rejected rather than parsed
+MAX_BYTES = 2_000_000
+
+# Token budget for article text in one request, leaving room for the output
+MAX_INPUT_TOKENS = 100_000
+
+# Extracted article text is cached here for a week; delete the dir to reset
+CACHE_DIR = ".article_cache"
+CACHE_TTL = 7 * 86400
+# Part of the cache key; bump whenever parse_article_text's output changes
+EXTRACTOR_VERSION = 2
+
+# Pages with less text than this (paywalls, cookie walls, soft 404s) aren't summarized
+MIN_ARTICLE_CHARS = 500
+
+# Whitespace collapsing for extracted text; stray spaces and blank lines cost tokens
+SPACES_RE = re.compile(r"[^\S\n]+")
+LINE_EDGE_RE = re.compile(r" ?\n ?")
+BLANK_LINES_RE = re.compile(r"\n{3,}")
+
+
+# Retry transient network failures up to 3 times with exponential backoff
+def is_transient_fetch_error(e: BaseException) -> bool:
+    """True for network errors and 429/5xx responses; 404 and friends are final."""
+    if isinstance(e, httpx.HTTPStatusError):
+        status = e.response.status_code
+        return status == 429 or status >= 500
+    return isinstance(e, httpx.TransportError)
+
+
+fetch_retry = retry(
+    stop=stop_after_attempt(3),
+    wait=wait_exponential(multiplier=1, min=2, max=30),
+    retry=retry_if_exception(is_transient_fetch_error),
+    reraise=True,
+)
+llm_retry = retry(
+    stop=stop_after_attempt(3),
+    wait=wait_exponential(multiplier=1, min=2, max=30),
+    retry=retry_if_exception_type(
+        (litellm.RateLimitError, litellm.APIConnectionError)
+    ),
+    reraise=True,
+)
+
+
+@fetch_retry
+async def fetch_html(url: str, client: httpx.AsyncClient) -> bytes:
+    """Download the raw HTML of a web page, up to MAX_BYTES."""
+    async with client.stream("GET", url) as response:
+        response.raise_for_status()
+        if int(response.headers.get("content-length", 0)) > MAX_BYTES:
+            raise ValueError(f"page larger than {MAX_BYTES} bytes")
 
+        # Stream the body so oversized pages are dropped without buffering them
+        content = bytearray()
+        async for chunk in response.aiter_bytes(64 * 1024):
+            content += chunk
+            if len(content) > MAX_BYTES:
+                raise ValueError(f"page larger than {MAX_BYTES} bytes")
+        return bytes(content)
 
-def extract_article_text(url: str) -> str:
-    """Extract readable text content from a web page."""
+
+def parse_article_text(content: bytes) -> str:
+    """Pull the paragraph text out of an HTML page."""
+    tree = HTMLParser(content)
+
+    # Extract paragraphs, dropping repeats such as menu and footer text
+    paragraphs = dict.fromkeys(p.text().strip() for p in tree.css("p"))
+    text = "\n".join(p for p in paragraphs if p)
+
+    # Collapse runs of spaces/tabs and excess blank lines
+    text = SPACES_RE.sub(" ", text)
+    text = LINE_EDGE_RE.sub("\n", text)
+    return BLANK_LINES_RE.sub("\n\n", text).strip()
+
+
+def open_article_cache() -> Optional[diskcache.Cache]:
+    """Open the on-disk article cache, or return None if it can't be used."""
     try:
-        response = requests.get(url, timeout=10)
-        response.raise_for_status()
-        soup = BeautifulSoup(response.content, "html.parser")
+        return diskcache.Cache(CACHE_DIR)
+    except Exception as e:
+        print(f"Article cache unavailable, fetching every page: {e}")
+        return None
 
-        # Remove script and style elements
-        for script in soup(["script", "style"]):
-            script.decompose()
 
-        # Extract paragraphs
-        paragraphs = soup.find_all("p")
-        article_text = "\n".join(p.get_text() for p in paragraphs)
+async def extract_article_text(
+    url: str, client: httpx.AsyncClient, cache: Optional[diskcache.Cache]
+) -> str:
+    """Extract readable text content from a web page."""
+    # The cache is only an optimization: on any cache error, fetch the page.
+    # SQLite-backed cache calls block, so keep them off the event loop too.
+    key = f"v{EXTRACTOR_VERSION}:{hashlib.sha1(url.encode()).hexdigest()}"
+    if cache is not None:
+        try:
+            article_text = await asyncio.to_thread(cache.get, key)
+        except Exception as e:
+            print(f"  Cache read failed for {url}: {e}")
+            article_text = None
+        if article_text is not None:
+            return article_text
 
-        return article_text.strip()
+    try:
+        content = await fetch_html(url, client)
+        # Parse in a worker thread so other fetches aren't stalled by big pages
+        article_text = await asyncio.to_thread(parse_article_text, content)
+
+        if article_text and cache is not None:
+            try:
+                await asyncio.to_thread(
+                    cache.set, key, article_text, expire=CACHE_TTL
+                )
+            except Exception as e:
+                print(f"  Cache write failed for {url}: {e}")
+        return article_text
     except Exception as e:
         print(f"Error extracting content from {url}: {e}")
         return ""
 
 
+def normalize_url(url: str) -> str:
+    """Lowercase the scheme and host and drop the fragment."""
+    parts = urlsplit(url)
+
+    # Only host[:port] is case-insensitive; keep any user:password@ as written
+    userinfo, at, hostport = parts.netloc.rpartition("@")
+    netloc = f"{userinfo}{at}{hostport.lower()}"
+
+    return urlunsplit((parts.scheme.lower(), netloc, parts.path, parts.query, ""))
+
+
 def read_text_file(filepath: str) -> str:
     """Read text content from a file."""
     try:
@@ -53,21 +209,83 @@ def read_text_file(filepath: str) -> str:
         return ""
 
 
-def summarize_with_prompt(article_text: str) -> str:
-    """Send article text to AI for summarization using the prompt template."""
-    try:
-        with open("prompt.txt", "r") as f:
-            prompt_template = f.read()
+@functools.lru_cache(maxsize=1)
+def get_encoding() -> tiktoken.Encoding:
+    """Load the tokenizer once; gpt-4o's encoding approximates other models."""
+    return tiktoken.encoding_for_model("gpt-4o")
 
-        full_prompt = prompt_template.replace(
-            "{{ insert blog post or raw dev thread here }}", article_text
-        )
 
-        response = litellm.completion(
-            # model="gpt-4o",
-            model="xai/grok-4",
-            messages=[{"role": "user", "content": full_prompt}],
-            temperature=0.5,
+def truncate_to_tokens(text: str, max_tokens: int) -> str:
+    """Cut text down to at most max_tokens tokens."""
+    tokens = get_encoding().encode(text, disallowed_special=())
+    if len(tokens) <= max_tokens:
+        return text
+
+    print(f"  Truncating article from {len(tokens)} to {max_tokens} tokens")
+    return get_encoding().decode(tokens[:max_tokens])
+
+
+@functools.lru_cache(maxsize=None)
+def load_prompt_template(path: str = PROMPT_FILE) -> str:
+    """Read a prompt template once and reuse it for every article."""
+    if not os.path.exists(path):
+        print(f"{path} not found, using the built-in prompt")
+        return DEFAULT_PROMPT_TEMPLATE
+
+    with open(path, "r") as f:
+        return f.read()
+
+
+def build_messages(
+    content: str, model: str = MODEL, prompt_file: str = PROMPT_FILE
+) -> list[dict]:
+    """Split the prompt template around the content into chat messages.
+
+    The template text before the placeholder is the same for every request,
+    so it is sent first as its own system message where provider prompt
+    caching can match it; the variable content goes last.
+    """
+    prefix, _, suffix = load_prompt_template(prompt_file).partition(PROMPT_PLACEHOLDER)
+
+    messages = []
+    if prefix:
+        # Anthropic only caches blocks that are explicitly marked
+        if model.startswith("anthropic/") or "claude" in model:
+            system_content = [
+                {"type": "text", "text": prefix, "cache_control": {"type": "ephemeral"}}
+            ]
+        else:
+            system_content = prefix
+        messages.append({"role": "system", "content": system_content})
+
+    messages.append({"role": "user", "content": content + suffix})
+    return messages
+
+
+@llm_retry
+def complete(messages: list[dict], **kwargs):
+    """Call litellm.completion with the configured model."""
+    return litellm.completion(
+        model=MODEL, messages=messages, temperature=0.5, **kwargs
+    )
+
+
+@llm_retry
+async def acomplete(messages: list[dict], **kwargs):
+    """Call litellm.acompletion with the configured model."""
+    return await litellm.acompletion(
+        model=MODEL, messages=messages, temperature=0.5, **kwargs
+    )
+
+
+def summarize_with_prompt(article_text: str, prompt_file: str = PROMPT_FILE) -> str:
+    """Send article text to AI for summarization using the prompt template."""
+    try:
+        response = complete(
+            build_messages(
+                truncate_to_tokens(article_text, MAX_INPUT_TOKENS),
+                prompt_file=prompt_file,
+            )
         )
 
         return response["choices"][0]["message"]["content"]
@@ -76,42 +294,299 @@ def summarize_with_prompt(article_text: str) -> str:
         return ""
 
 
-def process_urls_from_file(urls_file: str, output_dir: str = "summaries") -> None:
-    """Process URLs from a text file and save summaries as markdown files."""
-    if not os.path.exists(output_dir):
-        os.makedirs(output_dir)
+def build_multi_prompt(article_texts: list[str]) -> str:
+    """Pack several articles into one request body that asks for JSON summaries."""
+    # Split the token budget evenly so one long article can't crowd out the rest
+    max_tokens = MAX_INPUT_TOKENS // len(article_texts)
+    articles = "\n\n".join(
+        f"=== ARTICLE {i} ===\n{truncate_to_tokens(text, max_tokens)}"
+        for i, text in enumerate(article_texts, 1)
+    )
+    return (
+        f"There are {len(article_texts)} separate articles below, each starting "
+        "with an '=== ARTICLE <index> ===' line. Apply the instructions above to "
+        "each article independently.\n"
+        'Respond with a JSON object of the form {"summaries": [{"index": '
+        '<index>, "summary": "<markdown summary>"}]} with one entry per article.'
+        f"\n\n{articles}"
+    )
+
 
+def parse_multi_summary(content: str, count: int) -> list[str]:
+    """Map the JSON summaries of a multi-article response back by index."""
+    summaries = [""] * count
     try:
-        with open(urls_file, "r") as f:
-            urls = [
-                line.strip() for line in f if line.strip() and not line.startswith("#")
-            ]
+        for item in json.loads(content)["summaries"]:
+            index = int(item["index"]) - 1
+            summary = item["summary"]
+            if 0 <= index < count and isinstance(summary, str):
+                summaries[index] = summary
+    except (ValueError, KeyError, TypeError) as e:
+        print(f"Error parsing summaries: {e}")
+    return summaries
+
+
+def group_articles(article_texts: list[str], size: int) -> list[list[str]]:
+    """Split articles into consecutive groups of at most size."""
+    return [article_texts[i : i + size] for i in range(0, len(article_texts), size)]
+
+
+async def summarize_group(
+    group: list[str], sem: asyncio.BoundedSemaphore, prompt_file: str = PROMPT_FILE
+) -> list[str]:
+    """Summarize a group of articles in a single LLM request."""
+    async with sem:
+        try:
+            response = await acomplete(
+                build_messages(build_multi_prompt(group), prompt_file=prompt_file),
+                response_format={"type": "json_object"},
+            )
+            content = response["choices"][0]["message"]["content"]
+        except Exception as e:
+            print(f"Error summarizing content: {e}")
+            return [""] * len(group)
+
+    return parse_multi_summary(content, len(group))
+
+
+async def summarize_batch(
+    article_texts: list[str],
+    articles_per_request: int = ARTICLES_PER_REQUEST,
+    prompt_file: str = PROMPT_FILE,
+) -> list[str]:
+    """Summarize many articles with concurrent LLM requests.
+
+    Articles are packed articles_per_request at a time into each request,
+    and all requests are submitted before any result is collected. Returns
+    one summary per article, with "" for articles that failed.
+    """
+    groups = group_articles(article_texts, articles_per_request)
+    sem = asyncio.BoundedSemaphore(MAX_CONCURRENCY)
+    results = await asyncio.gather(
+        *[summarize_group(group, sem, prompt_file) for group in groups]
+    )
+    return [summary for group_summaries in results for summary in group_summaries]
+
 
-        for i, url in enumerate(urls, 1):
-            print(f"Processing URL {i}/{len(urls)}: {url}")
+def report_unfinished_batch(batch_id: Optional[str]) -> None:
+    """Tell the user where to find a submitted batch we stopped waiting for."""
+    if batch_id:
+        print(
+            f"Batch {batch_id} may still be running. Check it in the OpenAI "
+            f"dashboard or via the Batches API (GET /v1/batches/{batch_id})."
+        )
 
-            # Extract content
-            article_text = extract_article_text(url)
-            if not article_text:
-                print(f"  Skipping {url} - no content extracted")
+
+def summarize_with_batch_api(
+    article_texts: list[str],
+    articles_per_request: int = ARTICLES_PER_REQUEST,
+    prompt_file: str = PROMPT_FILE,
+) -> list[str]:
+    """Summarize articles through the OpenAI Batch API, waiting for the result.
+
+    Each packed group becomes one line of a JSONL batch file. The batch is
+    polled every BATCH_POLL_SECONDS until it finishes. Returns one summary
+    per article, with "" for articles that failed.
+    """
+    groups = group_articles(article_texts, articles_per_request)
+    summaries = [[""] * len(group) for group in groups]
+    batch_id = None
+    try:
+        lines = [
+            json.dumps(
+                {
+                    "custom_id": f"group_{i}",
+                    "method": "POST",
+                    "url": "/v1/chat/completions",
+                    "body": {
+                        "model": BATCH_MODEL,
+                        "messages": build_messages(
+                            build_multi_prompt(group), BATCH_MODEL, prompt_file
+                        ),
+                        "temperature": 0.5,
+                        "response_format": {"type": "json_object"},
+                    },
+                }
+            )
+            for i, group in enumerate(groups)
+        ]
+        batch_file = litellm.create_file(
+            file=("batch_input.jsonl", "\n".join(lines).encode("utf-8")),
+            purpose="batch",
+            custom_llm_provider="openai",
+        )
+        batch = litellm.create_batch(
+            completion_window="24h",
+            endpoint="/v1/chat/completions",
+            input_file_id=batch_file.id,
+            custom_llm_provider="openai",
+        )
+        batch_id = batch.id
+        print(f"Submitted batch {batch_id} ({len(groups)} requests)")
+
+        # A failed status check doesn't mean the batch failed; keep polling
+        poll_errors = 0
+        while batch.status not in ("completed", "failed", "expired", "cancelled"):
+            time.sleep(BATCH_POLL_SECONDS)
+            try:
+                batch = litellm.retrieve_batch(
+                    batch_id=batch_id, custom_llm_provider="openai"
+                )
+            except Exception as e:
+                poll_errors += 1
+                print(f"  Error checking batch {batch_id}: {e}")
+                if poll_errors >= BATCH_MAX_POLL_ERRORS:
+                    raise
                 continue
+            poll_errors = 0
+            print(f"  Batch {batch_id}: {batch.status}")
+
+        if not batch.output_file_id:
+            print(f"Error: batch {batch.id} finished as {batch.status} with no output")
+            return [""] * len(article_texts)
 
-            # Summarize
-            summary = summarize_with_prompt(article_text)
-            if not summary:
-                print(f"  Skipping {url} - no summary generated")
+        output = litellm.file_content(
+            file_id=batch.output_file_id, custom_llm_provider="openai"
+        )
+        for line in output.text.splitlines():
+            result = json.loads(line)
+            index = int(result["custom_id"].removeprefix("group_"))
+            response = result.get("response") or {}
+            if response.get("status_code") != 200:
+                print(f"Error summarizing content: {result.get('error')}")
                 continue
+            content = response["body"]["choices"][0]["message"]["content"]
+            summaries[index] = parse_multi_summary(content, len(groups[index]))
+    except KeyboardInterrupt:
+        report_unfinished_batch(batch_id)
+        raise
+    except Exception as e:
+        print(f"Error running batch: {e}")
+        report_unfinished_batch(batch_id)
+
+    return [summary for group_summaries in summaries for summary in group_summaries]
+
+
+def write_url_summary(filepath: str, url: str, summary: str) -> None:
+    """Write a single URL summary as a markdown file."""
+    content = f"# Summary for:\n{url}\n\n{summary}\n\n<br>\n"
+    Path(filepath).write_text(content, encoding="utf-8")
+
+
+async def fetch_url(
+    i: int,
+    total: int,
+    url: str,
+    sem: asyncio.BoundedSemaphore,
+    client: httpx.AsyncClient,
+    cache: Optional[diskcache.Cache],
+) -> str:
+    """Extract article text for a single URL."""
+    async with sem:
+        print(f"Processing URL {i}/{total}: {url}")
+        return await extract_article_text(url, client, cache)
 
-            # Save summary
-            filename = f"summary_{i:03d}.md"
-            filepath = os.path.join(output_dir, filename)
 
-            with open(filepath, "w") as f:
-                f.write(f"# Summary for:\n{url}\n\n")
-                f.write(summary)
-                f.write("\n\n<br>\n")
+async def fetch_articles(urls: list[str]) -> list[tuple[int, str, str]]:
+    """Fetch all URLs concurrently and return (index, url, text) for usable ones."""
+    sem = asyncio.BoundedSemaphore(MAX_CONCURRENCY)
+    # One cache handle and one pooled HTTP/2 client shared by every URL
+    cache = await asyncio.to_thread(open_article_cache)
+    try:
+        async with httpx.AsyncClient(
+            http2=True,
+            timeout=10,
+            follow_redirects=True,
+            limits=httpx.Limits(
+                max_connections=MAX_CONCURRENCY,
+                max_keepalive_connections=MAX_CONCURRENCY,
+            ),
+        ) as client:
+            texts = await asyncio.gather(
+                *[
+                    fetch_url(i, len(urls), url, sem, client, cache)
+                    for i, url in enumerate(urls, 1)
+                ]
+            )
+    finally:
+        if cache is not None:
+            try:
+                await asyncio.to_thread(cache.close)
+            except Exception as e:
+                print(f"Error closing article cache: {e}")
+
+    articles = []
+    for i, (url, article_text) in enumerate(zip(urls, texts), 1):
+        if not article_text:
+            print(f"  Skipping {url} - no content extracted")
+            continue
+        if len(article_text) < MIN_ARTICLE_CHARS:
+            print(f"  Skipping {url} - too short ({len(article_text)} chars)")
+            continue
+        articles.append((i, url, article_text))
+
+    return articles
+
+
+def write_url_summaries(
+    articles: list[tuple[int, str, str]], summaries: list[str], output_dir: str
+) -> None:
+    """Save each article's summary as a numbered markdown file."""
+    for (i, url, _), summary in zip(articles, summaries):
+        if not summary:
+            print(f"  Skipping {url} - no summary generated")
+            continue
+
+        filename = f"summary_{i:03d}.md"
+        filepath = os.path.join(output_dir, filename)
+        write_url_summary(filepath, url, summary)
+
+        print(f"  Saved summary to {filepath}")
+
+
+def process_urls_from_file(
+    urls_file: str,
+    output_dir: str = "summaries",
+    articles_per_request: int = ARTICLES_PER_REQUEST,
+    use_batch_api: bool = False,
+    prompt_file: str = PROMPT_FILE,
+) -> None:
+    """Process URLs from a text file and save summaries as markdown files."""
+    os.makedirs(output_dir, exist_ok=True)
 
-            print(f"  Saved summary to {filepath}")
+    try:
+        with open(urls_file, "r") as f:
+            urls = [
+                normalize_url(line.strip())
+                for line in f
+                if line.strip() and not line.startswith("#")
+            ]
+
+        # Drop repeated URLs, keeping the first occurrence's position
+        unique_urls = list(dict.fromkeys(urls))
+        if len(unique_urls) < len(urls):
+            print(f"Removed {len(urls) - len(unique_urls)} duplicate URLs")
+        urls = unique_urls
+
+        articles = asyncio.run(fetch_articles(urls))
+        if not articles:
+            return
+
+        # Summarize
+        print(f"Summarizing {len(articles)} articles...")
+        article_texts = [article_text for _, _, article_text in articles]
+        if use_batch_api:
+            # Runs on the main thread, outside the event loop, so Ctrl-C
+            # interrupts the (possibly day-long) polling right away
+            summaries = summarize_with_batch_api(
+                article_texts, articles_per_request, prompt_file
+            )
+        else:
+            summaries = asyncio.run(
+                summarize_batch(article_texts, articles_per_request, prompt_file)
+            )
+
+        write_url_summaries(articles, summaries, output_dir)
 
     except FileNotFoundError:
         print(f"Error: Could not find file {urls_file}")
@@ -119,7 +594,9 @@ def process_urls_from_file(urls_file: str, output_dir: str = "summaries") -> Non
         print(f"Error processing URLs: {e}")
 
 
-def process_text_file(text_file: str, output_file: str = None) -> None:
+def process_text_file(
+    text_file: str, output_file: str = None, prompt_file: str = PROMPT_FILE
+) -> None:
     """Process a single text file and save the summary."""
     print(f"Processing text file: {text_file}")
 
@@ -130,7 +607,7 @@ def process_text_file(text_file: str, output_file: str = None) -> None:
         return
 
     # Summarize
-    summary = summarize_with_prompt(article_text)
+    summary = summarize_with_prompt(article_text, prompt_file)
     if not summary:
         print(f"Error: Could not generate summary for {text_file}")
         return
@@ -142,14 +619,20 @@ def process_text_file(text_file: str, output_file: str = None) -> None:
         # output_file = f"{base_name}_summary.md"
 
     # Save summary
-    with open(output_file, "w") as f:
-        f.write(f"# Summary for: {text_file}\n\n")
-        f.write(summary)
-        f.write("\n")
+    content = f"# Summary for: {text_file}\n\n{summary}\n"
+    Path(output_file).write_text(content, encoding="utf-8")
 
     print(f"Saved summary to {output_file}")
 
 
+def positive_int(value: str) -> int:
+    """argparse type for options that must be at least 1."""
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {value}")
+    return number
+
+
 def main():
     """Main function to run the content summarizer."""
     parser = argparse.ArgumentParser(
@@ -171,14 +654,33 @@ def main():
         default=None,
         help="Output location: directory for web mode, file for text mode",
     )
+    parser.add_argument(
+        "--articles-per-request",
+        type=positive_int,
+        default=ARTICLES_PER_REQUEST,
+        help="Web mode: number of articles summarized per LLM request",
+    )
+    parser.add_argument(
+        "--prompt-template",
+        default=None,
+        help="Prompt template file (default: prompt.txt, or a built-in prompt if missing)",
+    )
+    parser.add_argument(
+        "--batch",
+        action="store_true",
+        help="Web mode only: use the OpenAI Batch API (half price, may take up to 24h)",
+    )
 
     args = parser.parse_args()
 
-    # Check if prompt.txt exists
-    if not os.path.exists("prompt.txt"):
-        print("Error: prompt.txt not found. Please create it with your summarization prompt.")
-        print("Example content: 'Please summarize the following content:\n\n{{ insert blog post or raw dev thread here }}'")
+    if args.batch and args.mode != "web":
+        parser.error("--batch is only supported in web mode")
+
+    if args.prompt_template and not os.path.exists(args.prompt_template):
+        print(f"Error: prompt template {args.prompt_template} not found.")
+        print(f"Example content: {DEFAULT_PROMPT_TEMPLATE!r}")
         return
+    prompt_file = args.prompt_template or PROMPT_FILE
 
     if args.mode == "web":
         # Web mode: process URLs
@@ -194,7 +696,9 @@ def main():
             print(f"Please add URLs to {urls_file} and run again.")
             return
 
-        process_urls_from_file(urls_file, output_dir)
+        process_urls_from_file(
+            urls_file, output_dir, args.articles_per_request, args.batch, prompt_file
+        )
 
     else:
         # Text mode: process single text file
@@ -205,7 +709,7 @@ def main():
             print("Please specify a text file using --input or create input.txt")
             return
 
-        process_text_file(text_file, args.output)
+        process_text_file(text_file, args.output, prompt_file)
 
 
 if __name__ == "__main__":